@@ -17,40 +17,149 @@ import json
 from pathlib import Path
 from datetime import datetime
 import zlib
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
+# Optional: NumPy + Numba accelerate the per-byte QR checksum loops from
+# interpreter speed (~20-50 MB/s) to native speed. Pure-Python fallback below.
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
 
-def calculate_qr_checksum_old(file_data):
-    """Calculate OLD QR checksum (for compatibility with older Windows files)"""
-    hash_val = 0
-    for byte in file_data:
-        hash_val = ((hash_val << 5) - hash_val) + byte
-        hash_val = hash_val & 0xFFFFFFFF  # Keep as 32-bit
-    
-    # Convert to base36 same as JavaScript (old method)
+# Optional: BLAKE3 runs 5-6x faster than SHA-256 with equivalent collision
+# resistance for transfer verification; reports include it when installed
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# Optional: XXH3-128 is an order of magnitude faster than the cryptographic
+# hashes and collision-safe for non-adversarial transfer verification, so
+# compare_reports can use it as a short-circuit identity check
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Optional: orjson serializes the JSON report 3-10x faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _write_json(obj, path):
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+# Optional: CRC32C dispatches to the SSE4.2 / ARMv8 CRC instruction (~20x the
+# throughput of zlib's software CRC32). The IEEE crc32 field is kept for
+# legacy reports; note the polynomial differs (Castagnoli vs IEEE).
+try:
+    import google_crc32c
+
+    def _crc32c_update(chunk, crc):
+        return google_crc32c.extend(crc, chunk)
+except ImportError:
+    try:
+        import crc32c as _crc32c_mod
+
+        def _crc32c_update(chunk, crc):
+            return _crc32c_mod.crc32c(chunk, crc)
+    except ImportError:
+        _crc32c_update = None
+
+_BASE36_CHARS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def _to_base36(num):
+    """Convert unsigned 32-bit value to base36 string (same as JavaScript encoders)"""
     result = ""
-    num = abs(hash_val)  # Use abs() like old algorithm
-    chars = "0123456789abcdefghijklmnopqrstuvwxyz"
     while num > 0:
-        result = chars[num % 36] + result
+        result = _BASE36_CHARS[num % 36] + result
         num //= 36
     return result[:8] if result else "0"
 
 
-def calculate_qr_checksum_fnv1a(file_data):
-    """Calculate Enhanced FNV-1a checksum (current HTML encoder/decoder algorithm)"""
-    hash_val = 2166136261  # FNV-1a offset basis
-    for byte in file_data:
+if njit is not None:
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _qr_djb2_kernel(arr, h0):
+        h = np.uint32(h0)
+        for i in range(arr.shape[0]):
+            h = np.uint32(h * np.uint32(31) + arr[i])  # same as ((h<<5)-h)+b
+        return h
+
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _qr_fnv1a_kernel(arr, h0):
+        h = np.uint32(h0)
+        for i in range(arr.shape[0]):
+            h = np.uint32((h ^ arr[i]) * np.uint32(16777619))
+        return h
+
+    # Warm up the JIT on a tiny buffer so compile cost doesn't hit the first file
+    _warmup = np.zeros(1, dtype=np.uint8)
+    _qr_djb2_kernel(_warmup, 0)
+    _qr_fnv1a_kernel(_warmup, 2166136261)
+    del _warmup
+
+
+# The djb2 hash is the polynomial sum(b_i * 31^(n-1-i)) mod 2^32, so blocks can
+# be hashed independently and folded left-to-right: h = h * 31^len + h_block.
+_QR_BLOCK = 1 << 20
+_POW31_BLOCK = pow(31, _QR_BLOCK, 1 << 32)
+
+
+def _qr_djb2_combine(hash_val, block_hash, block_len):
+    """Fold an independently hashed block into hash_val (mod 2^32)"""
+    power = _POW31_BLOCK if block_len == _QR_BLOCK else pow(31, block_len, 1 << 32)
+    return (hash_val * power + block_hash) & 0xFFFFFFFF
+
+
+def _qr_djb2(data, hash_val=0):
+    """djb2-style x31 hash over a buffer, continuing from state hash_val"""
+    if njit is not None:
+        arr = np.frombuffer(data, dtype=np.uint8)
+        # Hash large buffers block-parallel: the nogil kernel releases the GIL,
+        # so threads scale near-linearly, then partial hashes combine closed-form
+        if arr.shape[0] > 4 * _QR_BLOCK:
+            blocks = [arr[i:i + _QR_BLOCK] for i in range(0, arr.shape[0], _QR_BLOCK)]
+            with ThreadPoolExecutor(max_workers=min(len(blocks), os.cpu_count() or 1)) as pool:
+                partials = list(pool.map(lambda b: int(_qr_djb2_kernel(b, 0)), blocks))
+            for block, partial in zip(blocks, partials):
+                hash_val = _qr_djb2_combine(hash_val, partial, block.shape[0])
+            return hash_val
+        return int(_qr_djb2_kernel(arr, hash_val))
+    for byte in data:
+        hash_val = ((hash_val << 5) - hash_val) + byte
+        hash_val = hash_val & 0xFFFFFFFF  # Keep as 32-bit
+    return hash_val
+
+
+def _qr_fnv1a(data, hash_val=2166136261):
+    """FNV-1a hash over a buffer, continuing from state hash_val"""
+    if njit is not None:
+        return int(_qr_fnv1a_kernel(np.frombuffer(data, dtype=np.uint8), hash_val))
+    for byte in data:
         hash_val ^= byte
         hash_val = (hash_val * 16777619) & 0xFFFFFFFF  # FNV-1a prime, keep 32-bit
-    
-    # Convert to base36 same as JavaScript
-    result = ""
-    num = hash_val  # No abs() in FNV-1a
-    chars = "0123456789abcdefghijklmnopqrstuvwxyz"
-    while num > 0:
-        result = chars[num % 36] + result
-        num //= 36
-    return result[:8] if result else "0"
+    return hash_val
+
+
+def calculate_qr_checksum_old(file_data):
+    """Calculate OLD QR checksum (for compatibility with older Windows files)"""
+    # hash value is already unsigned 32-bit, so the old abs() was a no-op
+    return _to_base36(_qr_djb2(file_data))
+
+
+def calculate_qr_checksum_fnv1a(file_data):
+    """Calculate Enhanced FNV-1a checksum (current HTML encoder/decoder algorithm)"""
+    return _to_base36(_qr_fnv1a(file_data))
 
 
 def calculate_qr_checksum(file_data):
@@ -58,24 +167,121 @@ def calculate_qr_checksum(file_data):
     return calculate_qr_checksum_fnv1a(file_data)
 
 
-def calculate_checksums(file_path):
-    """Calculate multiple checksums for a file"""
+_READ_CHUNK = 1 << 20  # 1 MiB: keeps memory O(chunk) and lets the OS prefetch
+
+# hashlib.update() and zlib.crc32 release the GIL, so the per-chunk hashers can
+# run concurrently and per-file time collapses to max() instead of sum()
+_hash_pool = None
+
+
+def _get_hash_pool():
+    global _hash_pool
+    if _hash_pool is None:
+        _hash_pool = ThreadPoolExecutor(max_workers=6)
+    return _hash_pool
+
+
+def stat_file(file_path):
+    """Get size-only metadata with a single stat syscall — no file reads.
+
+    Lets size-only consumers (e.g. a dry-run mismatch scan) avoid hashing.
+    """
+    try:
+        return {'size': os.stat(file_path).st_size, 'file_path': str(file_path)}
+    except Exception as e:
+        return {'error': str(e), 'file_path': str(file_path)}
+
+
+# 'qr' covers all three QR checksum variants; optional algorithms are simply
+# skipped when their wheel is not installed
+_ALL_ALGOS = frozenset({'qr', 'md5', 'sha1', 'sha256', 'crc32',
+                        'blake3', 'crc32c', 'xxh3_128'})
+
+
+def calculate_checksums(file_path, algos=None):
+    """Calculate checksums for a file in one streaming pass.
+
+    Args:
+        file_path: File to hash
+        algos: Subset of _ALL_ALGOS to compute (default: all available).
+               Only the requested hashers are constructed and updated.
+    """
+    algos = _ALL_ALGOS if algos is None else frozenset(algos)
     try:
+        # Size comes from stat up front rather than counting read bytes
+        size = os.stat(file_path).st_size
+        md5 = hashlib.md5() if 'md5' in algos else None
+        sha1 = hashlib.sha1() if 'sha1' in algos else None
+        sha256 = hashlib.sha256() if 'sha256' in algos else None
+        b3 = blake3.blake3() if blake3 is not None and 'blake3' in algos else None
+        xxh3 = xxhash.xxh3_128() if xxhash is not None and 'xxh3_128' in algos else None
+        crc32 = 0 if 'crc32' in algos else None
+        crc32c = 0 if _crc32c_update is not None and 'crc32c' in algos else None
+        want_qr = 'qr' in algos
+        qr_old = 0
+        qr_fnv1a = 2166136261  # FNV-1a offset basis
+        pool = _get_hash_pool()
+
         with open(file_path, 'rb') as f:
-            data = f.read()
-        
+            while True:
+                chunk = f.read(_READ_CHUNK)
+                if not chunk:
+                    break
+                # All requested hashers consume the same chunk before the next read
+                futures = []
+                if md5 is not None:
+                    futures.append(pool.submit(md5.update, chunk))
+                if sha1 is not None:
+                    futures.append(pool.submit(sha1.update, chunk))
+                if sha256 is not None:
+                    futures.append(pool.submit(sha256.update, chunk))
+                if b3 is not None:
+                    futures.append(pool.submit(b3.update, chunk))
+                if xxh3 is not None:
+                    futures.append(pool.submit(xxh3.update, chunk))
+                crc32_future = None
+                if crc32 is not None:
+                    crc32_future = pool.submit(zlib.crc32, chunk, crc32)
+                crc32c_future = None
+                if crc32c is not None:
+                    crc32c_future = pool.submit(_crc32c_update, chunk, crc32c)
+                qr_old_future = qr_fnv1a_future = None
+                if want_qr:
+                    qr_old_future = pool.submit(_qr_djb2, chunk, qr_old)
+                    qr_fnv1a_future = pool.submit(_qr_fnv1a, chunk, qr_fnv1a)
+                for future in futures:
+                    future.result()
+                if crc32_future is not None:
+                    crc32 = crc32_future.result()
+                if crc32c_future is not None:
+                    crc32c = crc32c_future.result()
+                if want_qr:
+                    qr_old = qr_old_future.result()
+                    qr_fnv1a = qr_fnv1a_future.result()
+
         checksums = {
-            'qr_checksum_old': calculate_qr_checksum_old(data),
-            'qr_checksum_fnv1a': calculate_qr_checksum_fnv1a(data),
-            'qr_checksum': calculate_qr_checksum_fnv1a(data),  # Default to current
-            'md5': hashlib.md5(data).hexdigest(),
-            'sha1': hashlib.sha1(data).hexdigest(),
-            'sha256': hashlib.sha256(data).hexdigest(),
-            'crc32': format(zlib.crc32(data) & 0xffffffff, '08x'),
-            'size': len(data),
+            'size': size,
             'file_path': str(file_path)
         }
-        
+        if want_qr:
+            checksums['qr_checksum_old'] = _to_base36(qr_old)
+            checksums['qr_checksum_fnv1a'] = _to_base36(qr_fnv1a)
+            checksums['qr_checksum'] = _to_base36(qr_fnv1a)  # Default to current
+        if md5 is not None:
+            checksums['md5'] = md5.hexdigest()
+        if sha1 is not None:
+            checksums['sha1'] = sha1.hexdigest()
+        if sha256 is not None:
+            checksums['sha256'] = sha256.hexdigest()
+        if crc32 is not None:
+            checksums['crc32'] = format(crc32 & 0xffffffff, '08x')
+        if b3 is not None:
+            checksums['blake3'] = b3.hexdigest()
+        if crc32c is not None:
+            checksums['crc32c'] = format(crc32c & 0xffffffff, '08x')
+        if xxh3 is not None:
+            checksums['xxh3_128'] = xxh3.hexdigest()
+
         return checksums
     except Exception as e:
         return {'error': str(e), 'file_path': str(file_path)}
@@ -101,21 +307,31 @@ def scan_directory(directory, output_file=None):
         }
     }
     
-    # Scan all files
-    for file_path in directory.rglob('*'):
-        if file_path.is_file():
+    # Collect files first, largest first so the pool stays evenly loaded (LPT)
+    files = [p for p in directory.rglob('*') if p.is_file()]
+    files.sort(key=lambda p: p.stat().st_size, reverse=True)
+
+    # Hash files in parallel: each worker streams its own file, so memory
+    # stays bounded and wall-time scales with core count
+    scanned = {}
+    with ProcessPoolExecutor() as executor:
+        future_to_path = {executor.submit(calculate_checksums, p): p for p in files}
+        for future in as_completed(future_to_path):
+            file_path = future_to_path[future]
             print(f"📄 Processing: {file_path.name}")
-            
-            checksums = calculate_checksums(file_path)
-            relative_path = str(file_path.relative_to(directory))
-            results['files'][relative_path] = checksums
-            
+            checksums = future.result()
+            scanned[file_path] = checksums
+
             if 'error' not in checksums:
                 results['summary']['total_files'] += 1
                 results['summary']['total_size'] += checksums['size']
             else:
                 results['summary']['errors'] += 1
                 print(f"❌ Error processing {file_path.name}: {checksums['error']}")
+
+    # Report files in stable path order regardless of completion order
+    for file_path in sorted(scanned):
+        results['files'][str(file_path.relative_to(directory))] = scanned[file_path]
     
     # Generate report
     report_lines = [
@@ -144,8 +360,7 @@ def scan_directory(directory, output_file=None):
     
     # Save JSON version for programmatic use
     json_path = output_path.replace('.txt', '.json')
-    with open(json_path, 'w') as f:
-        json.dump(results, f, indent=2)
+    _write_json(results, json_path)
     
     print(f"\n📊 Summary:")
     print(f"   Files processed: {results['summary']['total_files']}")
@@ -211,7 +426,9 @@ def verify_files(file1, file2, detailed=False):
 def hash_file(file_path, all_algorithms=False):
     """Calculate hash for a single file"""
     try:
-        checksums = calculate_checksums(file_path)
+        # Only the QR checksum is shown by default — skip the 4 unused hashes
+        algos = None if all_algorithms else {'qr'}
+        checksums = calculate_checksums(file_path, algos)
         
         if 'error' in checksums:
             print(f"❌ Error: {checksums['error']}")